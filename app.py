@@ -18,11 +18,29 @@ try:
 except:
     config = {}
 
-from src.indexing.vector_store import VectorStoreWrapper
+from src.indexing.vector_store import get_vector_store
 from src.generation.rag import RAGChain
+from src.cache.semantic_cache import SemanticCache
+from src.common.intent import is_greeting
 
 st.set_page_config(page_title="RAG ChatBot", page_icon="🤖", layout="wide")
 
+# --- 고정 UI 텍스트 (rerun마다 문자열을 다시 만들지 않도록 모듈 상수로) ---
+WELCOME_GUIDE = """
+**👋 환영합니다! 이렇게 사용해 보세요:**
+
+1. 왼쪽 사이드바에서 [📂 문서 필터]를 눌러 분석할 문서를 선택하세요.
+2. 아래 입력창에 궁금한 점을 물어보세요.
+
+> **(예시)** *"이 사업의 예산은 얼마야?", "제안서 제출 마감일은 언제야?"*
+"""
+
+# 인사/잡담에 대한 고정 응답 (검색·LLM 호출 없이 즉시 반환)
+GREETING_REPLY = (
+    "안녕하세요! 저는 RFP 문서를 분석해 드리는 AI 분석기예요. 🤖\n\n"
+    "왼쪽 사이드바에서 문서를 선택한 뒤, 예산·일정·평가 방법 같은 내용을 물어보세요!"
+)
+
 # --- [핵심] DB 로딩 함수 ---
 @st.cache_resource
 def load_vector_store(embedding_model_name):
@@ -39,9 +57,16 @@ def load_vector_store(embedding_model_name):
     temp_config["vector_db_path"] = target_path
     temp_config["embedding_model"] = embedding_model_name
     
-    wrapper = VectorStoreWrapper(temp_config)
-    wrapper.initialize()
-    return wrapper
+    # 모듈 레벨 싱글톤: 같은 (경로, 모델) 조합이면 이미 로딩된 DB를 재사용
+    return get_vector_store(temp_config)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_all_docs(_wrapper, embedding_model_name):
+    """
+    문서 목록을 60초 동안 캐시합니다. (rerun마다 Chroma 메타데이터 풀스캔 방지)
+    _wrapper는 해시 불가 객체라 언더스코어로 해싱 제외, 대신 모델명을 캐시 키로 사용.
+    """
+    return _wrapper.get_all_documents()
 
 def reset_selected_docs():
     st.session_state.selected_docs = []  # 문서 선택 초기화
@@ -78,7 +103,7 @@ with st.sidebar:
 # --- 시스템 로딩 및 하단 사이드바 UI ---
 try:
     vector_store_wrapper = load_vector_store(selected_embedding)
-    all_docs = vector_store_wrapper.get_all_documents()
+    all_docs = get_cached_all_docs(vector_store_wrapper, selected_embedding)
     
     with st.sidebar:
         st.subheader("📂 문서 필터")
@@ -120,10 +145,24 @@ if "rag_chain" not in st.session_state or st.session_state.get("current_settings
             vector_store_wrapper, 
             model_name=selected_llm
         )
+        # 첫 질문 전에 모델을 VRAM에 올려둠 (콜드스타트 방지)
+        st.session_state.rag_chain.warmup()
         st.session_state.current_settings = current_settings
     st.toast(f"✅ 시스템 설정 변경 완료!", icon="🔄")
 
 
+# --- 시맨틱 캐시 구성 ---
+# 비슷한 질문이 다시 들어오면 검색 + LLM 호출을 통째로 건너뜁니다.
+# 설정(임베딩/LLM)과 문서 필터가 같은 경우에만 캐시를 공유합니다.
+if "semantic_caches" not in st.session_state:
+    st.session_state.semantic_caches = {}
+
+cache_key = f"{current_settings}|{'|'.join(sorted(selected_docs))}"
+if cache_key not in st.session_state.semantic_caches:
+    st.session_state.semantic_caches[cache_key] = SemanticCache()
+semantic_cache = st.session_state.semantic_caches[cache_key]
+
+
 # --- 메인 화면 ---
 
 if "messages" not in st.session_state:
@@ -134,14 +173,7 @@ if len(st.session_state.messages) == 0:
     st.title("🤖 AI RFP 분석기")
     
     # 사용 가이드라인
-    st.info("""
-    **👋 환영합니다! 이렇게 사용해 보세요:**
-    
-    1. 왼쪽 사이드바에서 [📂 문서 필터]를 눌러 분석할 문서를 선택하세요.
-    2. 아래 입력창에 궁금한 점을 물어보세요.
-    
-    > **(예시)** *"이 사업의 예산은 얼마야?", "제안서 제출 마감일은 언제야?"*
-    """)
+    st.info(WELCOME_GUIDE)
 
 # 대화 기록 출력
 for msg in st.session_state.messages:
@@ -151,8 +183,11 @@ for msg in st.session_state.messages:
             st.caption(f"⏱️ 소요 시간: {msg['latency']:.2f}초")
         if "sources" in msg and msg["sources"]:
             with st.expander("📚 분석에 사용된 문서"):
-                for src in msg["sources"]:
-                    st.markdown(f"- **{src['source']}**: {src['content'][:100]}...")
+                # 출처들을 markdown 한 덩어리로 합쳐 위젯 생성을 1회로 줄임
+                st.markdown("\n".join(
+                    f"- **{src['source']}**: {src['content'][:100]}..."
+                    for src in msg["sources"]
+                ))
 
 # 질문 처리
 if prompt := st.chat_input("AI RFP 분석기에게 물어보기"):
@@ -162,24 +197,48 @@ if prompt := st.chat_input("AI RFP 분석기에게 물어보기"):
     with st.chat_message("user"):
         st.markdown(prompt)
 
+    # 인사/잡담은 RAG 파이프라인 전체(임베딩+검색+LLM)를 건너뛰고 즉시 응답
+    if is_greeting(prompt):
+        with st.chat_message("assistant"):
+            st.markdown(GREETING_REPLY)
+        st.session_state.messages.append({
+            "role": "assistant",
+            "content": GREETING_REPLY,
+            "sources": []
+        })
+        st.stop()
+
     with st.chat_message("assistant"):
         with st.spinner("🔍 분석 중..."):
             start_time = time.time()
-            
-            answer, docs = st.session_state.rag_chain.generate_answer(prompt, selected_docs)
-            
+
+            # 1. 시맨틱 캐시 조회 (질문 임베딩 1회로 끝)
+            query_vector = vector_store_wrapper.embedding.embed_query(prompt)
+            cached = semantic_cache.query(query_vector)
+
+            if cached:
+                answer, sources = cached
+                st.markdown(answer)
+            else:
+                # 2. 캐시 미스 → 전체 RAG 파이프라인 실행 후 캐시에 등록
+                # 토큰 스트리밍으로 첫 토큰부터 바로 화면에 출력합니다.
+                stream, docs = st.session_state.rag_chain.stream_answer(prompt, selected_docs)
+                answer = st.write_stream(stream)
+                sources = []
+                if docs:
+                    sources = [{"source": os.path.basename(d.metadata.get('source', 'Unknown')), "content": d.page_content} for d in docs]
+                semantic_cache.update(query_vector, answer, sources)
+
             end_time = time.time()
             elapsed_time = end_time - start_time
-            
-            st.markdown(answer)
             st.caption(f"⏱️ 소요 시간: {elapsed_time:.2f}초")
-            
-            sources = []
-            if docs:
-                sources = [{"source": os.path.basename(d.metadata.get('source', 'Unknown')), "content": d.page_content} for d in docs]
+
+            if sources:
                 with st.expander("📚 분석에 사용된 문서"):
-                    for s in sources:
-                        st.markdown(f"- **{s['source']}**: {s['content'][:200]}...")
+                    st.markdown("\n".join(
+                        f"- **{s['source']}**: {s['content'][:200]}..."
+                        for s in sources
+                    ))
 
             st.session_state.messages.append({
                 "role": "assistant",
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # 설정: 결과를 저장할 파일명
 OUTPUT_FILE = "project_context.txt"
@@ -7,36 +8,54 @@ OUTPUT_FILE = "project_context.txt"
 IGNORE_DIRS = {'.git', '.venv', '__pycache__', '.ipynb_checkpoints', 'rfp_database', 'data', 'rfp_database_v1'}
 
 # 설정: 포함할 파일 확장자 (필요한 것만 골라서)
-INCLUDE_EXTS = {'.py', '.md', '.txt', '.yml', '.yaml', '.json', 'Makefile', 'Dockerfile'}
+INCLUDE_EXTS = frozenset({'.py', '.md', '.txt', '.yml', '.yaml', '.json', 'Makefile', 'Dockerfile'})
+
+# 확장자 없이도 포함할 특수 파일들
+SPECIAL_FILES = frozenset({'Makefile', '.gitignore', 'requirements.txt'})
+
+def collect_files():
+    """내보낼 파일 경로 목록을 먼저 수집합니다."""
+    paths = []
+    for root, dirs, files in os.walk("."):
+        # 무시할 폴더는 탐색 리스트에서 제거 (하위 폴더까지 싹 무시됨)
+        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS and not d.startswith('rfp_database')]
+
+        for file in files:
+            # splitext 대신 rfind 한 번으로 확장자 추출 (튜플 할당 없음)
+            dot_pos = file.rfind('.')
+            ext = file[dot_pos:] if dot_pos >= 0 else ''
+            if ext in INCLUDE_EXTS or file in SPECIAL_FILES:
+                paths.append(os.path.join(root, file))
+    return paths
+
+def read_file(file_path):
+    """파일 하나를 읽어서 (경로, 내용, 에러) 튜플로 반환 (스레드에서 실행)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return file_path, f.read(), None
+    except Exception as e:
+        return file_path, None, e
 
 def main():
+    paths = collect_files()
+
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as outfile:
         # 헤더 작성
         outfile.write(f"# Project Export\n# Created by script\n\n")
-        
-        for root, dirs, files in os.walk("."):
-            # 무시할 폴더는 탐색 리스트에서 제거 (하위 폴더까지 싹 무시됨)
-            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS and not d.startswith('rfp_database')]
-            
-            for file in files:
-                file_ext = os.path.splitext(file)[1]
-                # Makefile 처럼 확장자 없는 파일도 포함하고 싶으면 조건 추가
-                if file_ext in INCLUDE_EXTS or file in ['Makefile', '.gitignore', 'requirements.txt']:
-                    file_path = os.path.join(root, file)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                        # 출력 포맷: 파일 경로와 내용을 구분해서 기록
-                        outfile.write(f"\n{'='*50}\n")
-                        outfile.write(f"File: {file_path}\n")
-                        outfile.write(f"{'='*50}\n")
-                        outfile.write(content + "\n")
-                        print(f"Included: {file_path}")
-                        
-                    except Exception as e:
-                        print(f"Skipped (Error): {file_path} - {e}")
+
+        # 파일 읽기(I/O)는 스레드 풀로 겹치고, 쓰기는 순서대로 처리
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for file_path, content, error in executor.map(read_file, paths):
+                if error is not None:
+                    print(f"Skipped (Error): {file_path} - {error}")
+                    continue
+
+                # 출력 포맷: 파일 경로와 내용을 구분해서 기록
+                outfile.write(f"\n{'='*50}\n")
+                outfile.write(f"File: {file_path}\n")
+                outfile.write(f"{'='*50}\n")
+                outfile.write(content + "\n")
+                print(f"Included: {file_path}")
 
     print(f"\n[완료] 모든 코드가 '{OUTPUT_FILE}'에 저장되었습니다.")
 
@@ -1,6 +1,11 @@
 import os
+import sys
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+
+# 프로젝트 루트를 경로에 추가 (src 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.common.cached_embeddings import CachedEmbeddings
 from langchain_community.vectorstores import Chroma
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -11,7 +16,8 @@ load_dotenv()
 DB_PATH = "./rfp_database"
 
 # 2. DB 및 검색기(Retriever) 설정
-embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+# 같은 질문을 다시 물으면 임베딩 API 호출 없이 디스크 캐시 사용
+embeddings = CachedEmbeddings(OpenAIEmbeddings(model="text-embedding-3-small"))
 if not os.path.exists(DB_PATH):
     print(f"❌ 에러: '{DB_PATH}'가 없습니다. main.py를 먼저 실행하세요.")
     exit()
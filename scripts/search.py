@@ -1,8 +1,13 @@
 import os
+import sys
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
 
+# 프로젝트 루트를 경로에 추가 (src 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.common.cached_embeddings import CachedEmbeddings
+
 # 1. 환경변수 로드 (공용 키 사용)
 load_dotenv()
 
@@ -12,7 +17,8 @@ DB_PATH = "./rfp_database"
 def test_search():
     # 저장된 DB 불러오기
     print("DB를 불러오는 중...")
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+    # 같은 질문을 다시 검색하면 임베딩 API 호출 없이 디스크 캐시 사용
+    embeddings = CachedEmbeddings(OpenAIEmbeddings(model="text-embedding-3-small"))
     
     # DB가 실제로 존재하는지 확인
     if not os.path.exists(DB_PATH):
@@ -0,0 +1,85 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    질문 임베딩 기반 시맨틱 캐시.
+
+    (질문 벡터 → 답변, 출처) 쌍을 메모리에 저장해두고,
+    새 질문이 기존 질문과 코사인 유사도가 threshold 이상이면
+    RAG 파이프라인(검색 + LLM 호출) 전체를 건너뜁니다.
+    """
+
+    def __init__(self, max_size=128, threshold=0.9):
+        self.max_size = max_size
+        self.threshold = threshold
+
+        # L2 정규화된 임베딩들을 (N, Dim) 행렬 하나로 관리 → 조회는 행렬곱 한 번
+        self._vectors = None
+        self._entries = []          # _vectors의 행과 1:1 대응하는 (answer, sources) 리스트
+        self._order = deque()       # LRU 순서 (가장 왼쪽이 가장 오래됨)
+
+        # Streamlit은 rerun이 동시에 돌 수 있으므로 락으로 보호
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _normalize(vector):
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        if norm == 0:
+            return v
+        return v / norm
+
+    def query(self, vector):
+        """
+        캐시 조회. 히트 시 (answer, sources) 반환, 미스 시 None 반환.
+        """
+        v = self._normalize(vector)
+        with self._lock:
+            if self._vectors is None or len(self._entries) == 0:
+                return None
+
+            # 정규화된 벡터끼리의 내적 = 코사인 유사도
+            scores = self._vectors @ v
+            best = int(np.argmax(scores))
+
+            if scores[best] < self.threshold:
+                return None
+
+            # 히트한 항목을 최근 사용으로 갱신
+            self._order.remove(best)
+            self._order.append(best)
+            return self._entries[best]
+
+    def update(self, vector, answer, sources):
+        """
+        캐시 미스 후 새로 생성한 답변을 등록합니다. 가득 차면 LRU 항목을 교체합니다.
+        """
+        v = self._normalize(vector)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = v.reshape(1, -1)
+                self._entries.append((answer, sources))
+                self._order.append(0)
+                return
+
+            if len(self._entries) < self.max_size:
+                idx = len(self._entries)
+                self._vectors = np.vstack([self._vectors, v])
+                self._entries.append((answer, sources))
+            else:
+                # 가장 오래 안 쓰인 행을 새 항목으로 덮어쓰기
+                idx = self._order.popleft()
+                self._vectors[idx] = v
+                self._entries[idx] = (answer, sources)
+
+            self._order.append(idx)
+
+    def clear(self):
+        with self._lock:
+            self._vectors = None
+            self._entries = []
+            self._order.clear()
@@ -0,0 +1,66 @@
+import os
+import json
+import hashlib
+
+from langchain_core.embeddings import Embeddings
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 API 호출 결과를 디스크에 캐시하는 래퍼.
+
+    같은 텍스트를 다시 임베딩하면 API 왕복(100~500ms) 없이
+    로컬 파일에서 바로 읽어옵니다. 키는 (모델명 + 텍스트)의 SHA-256.
+    """
+
+    def __init__(self, base_embeddings, cache_dir="./.cache/embeddings"):
+        self.base = base_embeddings
+        self.cache_dir = cache_dir
+        self.model_name = getattr(base_embeddings, "model", "unknown")
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _key(self, text):
+        raw = f"{self.model_name}|{text}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _load(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            # 깨진 캐시 파일은 미스로 취급
+            return None
+
+    def _save(self, key, vector):
+        with open(self._path(key), "w", encoding="utf-8") as f:
+            json.dump(vector, f)
+
+    def embed_query(self, text):
+        key = self._key(text)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+
+        vector = self.base.embed_query(text)
+        self._save(key, vector)
+        return vector
+
+    def embed_documents(self, texts):
+        keys = [self._key(t) for t in texts]
+        vectors = [self._load(k) for k in keys]
+
+        # 캐시에 없는 것만 모아서 한 번에 API 호출
+        miss_indices = [i for i, v in enumerate(vectors) if v is None]
+        if miss_indices:
+            new_vectors = self.base.embed_documents([texts[i] for i in miss_indices])
+            for i, vec in zip(miss_indices, new_vectors):
+                vectors[i] = vec
+                self._save(keys[i], vec)
+
+        return vectors
@@ -1,19 +1,32 @@
 import os
+from functools import lru_cache
+
 import yaml
 from dotenv import load_dotenv
 
+# libyaml C 로더가 있으면 사용 (순수 파이썬 로더보다 5~10배 빠름)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 load_dotenv()
 
+@lru_cache(maxsize=None)
+def _load_yaml(path):
+    """설정 파일을 한 번만 파싱하고 결과를 메모이즈합니다."""
+    if not os.path.exists(path):
+        # 파일이 없으면 빈 딕셔너리 반환 혹은 에러 처리
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 class ConfigLoader:
     def __init__(self, config_path: str = "config/local.yaml"):
         self.config = self._load_config(config_path)
 
     def _load_config(self, path):
-        if not os.path.exists(path):
-            # 파일이 없으면 빈 딕셔너리 반환 혹은 에러 처리
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return _load_yaml(path)
 
     def get(self, key, default=None):
         keys = key.split(".")
@@ -0,0 +1,40 @@
+import re
+
+# 인사/잡담 표현 하나에 해당하는 패턴 (메시지 '전체'가 이걸로만 이루어져야 함)
+# 주의: "감사"/"하이"/"hi" 같은 토큰은 실제 RFP 질문의 부분 문자열로 흔히 등장하므로
+# (감사 계획, 하이브리드, chip 등) 부분 일치가 아니라 인사 형태 전체로만 매칭합니다.
+_GREETING_TOKEN = (
+    r"(?:안녕(?:하세요|하십니까)?"
+    r"|하이"
+    r"|헬로우?"
+    r"|반가워요?|반갑습니다"
+    r"|고마워요?|고맙습니다"
+    r"|감사(?:합니다|해요|요|드려요)"
+    r"|잘\s?가요?"
+    r"|누구(?:야|니|세요)"
+    r"|뭐\s?해요?"
+    r"|hi|hello|thanks|thank\s+you)"
+)
+
+# 인사 토큰이 공백/문장부호를 사이에 두고 반복되는 경우까지 허용 ("안녕하세요 반갑습니다!")
+_GREETING_PATTERN = re.compile(
+    rf"{_GREETING_TOKEN}(?:[\s,!?.~^]*{_GREETING_TOKEN})*", re.IGNORECASE
+)
+
+# 메시지 양끝의 공백/문장부호 제거용
+_EDGE_CHARS = " \t\n!?.,~^…;:'\"()"
+
+
+def is_greeting(text):
+    """
+    RAG 검색 없이 바로 응대해도 되는 '순수한' 인사/잡담 입력인지 판별합니다.
+    인사말 외의 내용이 한 글자라도 섞여 있으면(= 실제 질문이면) False입니다.
+    """
+    stripped = text.strip()
+    if not stripped or len(stripped) > 20:
+        return False
+
+    cleaned = stripped.strip(_EDGE_CHARS)
+    if not cleaned:
+        return False
+    return _GREETING_PATTERN.fullmatch(cleaned) is not None
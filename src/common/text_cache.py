@@ -0,0 +1,35 @@
+import os
+import hashlib
+
+CACHE_DIR = "./.cache/text"
+
+
+def get_or_compute(path, compute_fn, cache_dir=CACHE_DIR):
+    """
+    (절대경로, mtime, 크기)를 키로 추출된 텍스트를 디스크에 캐시합니다.
+
+    원본 파일이 바뀌지 않았다면 HWP/PDF 재파싱 없이 캐시에서 바로 읽으므로,
+    파일 몇 개만 추가하고 DB를 다시 만들 때 전체 코퍼스를 재처리하지 않습니다.
+    """
+    try:
+        st = os.stat(path)
+        raw = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}"
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    except OSError:
+        # 파일 stat 실패 시에는 캐시 없이 그냥 계산
+        return compute_fn(path)
+
+    cache_path = os.path.join(cache_dir, key + ".txt")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception:
+            pass  # 깨진 캐시는 미스로 취급하고 다시 계산
+
+    text = compute_fn(path)
+    if text:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
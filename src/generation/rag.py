@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
@@ -29,9 +32,26 @@ class RAGChain:
             repeat_penalty=1.1,
             
             # [청수님 설정] max_new_tokens=512 -> Ollama에서는 'num_predict'
-            num_predict=512
+            num_predict=512,
+
+            # 모델을 VRAM에 상주시켜 유휴 후 첫 질문의 콜드스타트(10~30초)를 방지
+            keep_alive="24h"
         )
 
+        # 기본 모델 호출 실패(모델 미설치, VRAM 부족 등) 시 다른 모델로 자동 폴백
+        # → 에러로 답변 전체가 날아가 사용자가 재시도하는 것보다 훨씬 저렴함
+        fallback_model = "llama3.1" if self.model_name != "llama3.1" else "gemma3:12b"
+        self.llm_with_fallback = self.llm.with_fallbacks([
+            ChatOllama(
+                model=fallback_model,
+                temperature=0.1,
+                top_p=0.95,
+                repeat_penalty=1.1,
+                num_predict=512,
+                keep_alive="24h"
+            )
+        ])
+
         # 3. 프롬프트 템플릿
         self.prompt = ChatPromptTemplate.from_template("""
         당신은 RFP(제안요청서) 분석 전문가입니다.
@@ -53,39 +73,138 @@ class RAGChain:
         # 이제 체인은 이미 완성된 'context' 문자열과 'question'만 받아서 처리합니다.
         self.chain = (
             self.prompt
-            | self.llm
+            | self.llm_with_fallback
             | StrOutputParser()
         )
 
+        # 5. 검색 결과 LRU 캐시 (질문+필터가 완전히 같으면 벡터 검색 생략)
+        self._retrieval_cache = OrderedDict()
+        self._retrieval_cache_size = 128
+
+    def warmup(self):
+        """
+        LLM 가중치를 미리 VRAM에 올려두는 워밍업 호출.
+        첫 사용자 질문 전에 한 번 실행하면 콜드스타트 지연이 사라집니다.
+        """
+        try:
+            # 토큰 1개만 생성하도록 제한한 일회성 호출
+            self.llm.bind(num_predict=1).invoke("준비")
+        except Exception:
+            # Ollama 서버가 아직 안 떠 있어도 앱 자체는 계속 동작해야 함
+            pass
+
+    def batch_retrieve(self, question, selected_docs, k=5):
+        """
+        문서 필터가 여러 개일 때 파일별 벡터 검색을 스레드 풀로 동시에 날립니다.
+        Chroma 호출은 대부분 I/O 대기라서, 거대한 $or 필터 하나 대신
+        파일당 쿼리를 병렬로 돌리면 전체 시간이 '가장 느린 쿼리' 수준으로 줄어듭니다.
+        """
+        vector_store = self.vector_store_wrapper.vector_store
+
+        def search_one(doc_name):
+            return vector_store.similarity_search_with_score(
+                question, k=k, filter={"source": doc_name}
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(search_one, selected_docs))
+
+        # 점수(거리가 작을수록 유사)로 합쳐서 상위 k개만 남깁니다. 중복 청크는 제거.
+        merged = []
+        seen = set()
+        for pairs in results:
+            for doc, score in pairs:
+                key = (doc.metadata.get("source"), doc.page_content)
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append((doc, score))
+
+        merged.sort(key=lambda pair: pair[1])
+        return [doc for doc, _ in merged[:k]]
+
+    @staticmethod
+    def _dedupe(docs):
+        """
+        내용이 완전히 같은 청크를 제거합니다.
+        (청킹 overlap이나 문서 중복 수집 때문에 같은 텍스트가 여러 번 뽑히면
+        컨텍스트 길이만 낭비되고 LLM 생성도 느려짐)
+        """
+        seen = set()
+        unique = []
+        for doc in docs:
+            key = hash(doc.page_content)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(doc)
+        return unique
+
+    def _retrieve(self, question, selected_docs=[]):
+        """질문과 문서 필터에 맞는 문서를 검색해 리스트로 반환합니다."""
+        cache_key = (question, tuple(sorted(selected_docs)) if selected_docs else ())
+        cached = self._retrieval_cache.get(cache_key)
+        if cached is not None:
+            self._retrieval_cache.move_to_end(cache_key)
+            return cached
+
+        if selected_docs and len(selected_docs) > 1:
+            # 여러 문서 필터 → 파일별 쿼리를 병렬 실행 후 병합 (내부에서 중복 제거됨)
+            docs = self.batch_retrieve(question, selected_docs)
+        else:
+            search_kwargs = {"k": 5}
+            if selected_docs:
+                search_kwargs["filter"] = {"source": selected_docs[0]}
+            self.retriever.search_kwargs = search_kwargs
+            docs = self._dedupe(self.retriever.invoke(question))
+
+        self._retrieval_cache[cache_key] = docs
+        if len(self._retrieval_cache) > self._retrieval_cache_size:
+            self._retrieval_cache.popitem(last=False)
+        return docs
+
+    @staticmethod
+    def _format_context(docs):
+        """
+        검색된 문서에서 '글자'만 뽑아서 하나의 문자열로 합칩니다. (중요!)
+        이렇게 하면 AI는 절대 Document 객체(이상한 코드)를 볼 수 없습니다.
+        호출당 딱 한 번만 만들고, 생성/스트리밍 양쪽 경로가 공유합니다.
+        """
+        return "\n\n".join(doc.page_content for doc in docs)
+
     def generate_answer(self, question, selected_docs=[]):
         """
         1. 문서 검색 (Retrieve)
         2. 텍스트 변환 (Format)
         3. 답변 생성 (Generate)
         """
-        
-        # 필터링 설정
-        search_kwargs = {"k": 5}
-        if selected_docs:
-            if len(selected_docs) == 1:
-                search_kwargs["filter"] = {"source": selected_docs[0]}
-            else:
-                search_kwargs["filter"] = {
-                    "$or": [{"source": doc} for doc in selected_docs]
-                }
-        self.retriever.search_kwargs = search_kwargs
-        
+
         # [단계 1] 문서를 먼저 가져옵니다.
-        retrieved_docs = self.retriever.invoke(question)
-        
-        # [단계 2] 가져온 문서에서 '글자'만 뽑아서 하나의 문자열로 합칩니다. (중요!)
-        # 이렇게 하면 AI는 절대 Document 객체(이상한 코드)를 볼 수 없습니다.
-        context_text = "\n\n".join([doc.page_content for doc in retrieved_docs])
-        
+        retrieved_docs = self._retrieve(question, selected_docs)
+
+        # [단계 2] 컨텍스트 문자열 생성
+        context_text = self._format_context(retrieved_docs)
+
         # [단계 3] 깨끗한 텍스트를 체인에 넣어줍니다.
         answer = self.chain.invoke({
-            "context": context_text, 
+            "context": context_text,
             "question": question
         })
-        
-        return answer, retrieved_docs
\ No newline at end of file
+
+        return answer, retrieved_docs
+
+    def stream_answer(self, question, selected_docs=[]):
+        """
+        generate_answer와 같은 파이프라인이지만 답변을 토큰 단위로 스트리밍합니다.
+        전체 생성이 끝날 때까지 기다리지 않고 첫 토큰부터 바로 화면에 출력할 수 있어
+        체감 대기 시간이 '전체 생성 시간'에서 '첫 토큰 시간'으로 줄어듭니다.
+        """
+        retrieved_docs = self._retrieve(question, selected_docs)
+        context_text = self._format_context(retrieved_docs)
+
+        stream = self.chain.stream({
+            "context": context_text,
+            "question": question
+        })
+
+        return stream, retrieved_docs
\ No newline at end of file
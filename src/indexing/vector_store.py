@@ -1,6 +1,25 @@
 from langchain_chroma import Chroma
 from langchain_ollama import OllamaEmbeddings
 
+# (DB 경로, 임베딩 모델) → 초기화된 래퍼. 프로세스당 한 번만 DB를 로딩하기 위한 싱글톤.
+_INSTANCES = {}
+
+
+def get_vector_store(config):
+    """
+    같은 (DB 경로, 임베딩 모델) 조합이면 이미 초기화된 VectorStoreWrapper를 재사용합니다.
+    Streamlit 밖(스크립트 등)에서도 중복 로딩 없이 같은 인스턴스를 공유할 수 있습니다.
+    """
+    key = (
+        config.get("vector_db_path", "./rfp_database_bge"),
+        config.get("embedding_model", "bge-m3"),
+    )
+    if key not in _INSTANCES:
+        wrapper = VectorStoreWrapper(config)
+        wrapper.initialize()
+        _INSTANCES[key] = wrapper
+    return _INSTANCES[key]
+
 class VectorStoreWrapper:
     def __init__(self, config):
         self.config = config
@@ -12,8 +31,8 @@ class VectorStoreWrapper:
     def initialize(self):
         print(f"📂 DB 로딩 시작: {self.persist_directory} (Model: {self.embedding_model_name})")
         
-        # 동적으로 모델명 할당
-        self.embedding = OllamaEmbeddings(model=self.embedding_model_name)
+        # 동적으로 모델명 할당 (keep_alive로 임베딩 모델도 VRAM에 상주)
+        self.embedding = OllamaEmbeddings(model=self.embedding_model_name, keep_alive="24h")
         
         self.vector_store = Chroma(
             persist_directory=self.persist_directory,
@@ -24,7 +43,9 @@ class VectorStoreWrapper:
     def get_all_documents(self):
         if not self.vector_store:
             return []
-        # 메타데이터에서 source만 추출해서 중복 제거 후 반환
-        data = self.vector_store.get()
+        # source 목록만 필요하므로 메타데이터만 가져옵니다.
+        # (기본 .get()은 문서 본문까지 전부 끌어와서 컬렉션이 클수록 느려짐)
+        data = self.vector_store.get(include=["metadatas"])
         sources = set([meta.get('source').split('/')[-1] for meta in data['metadatas']])
-        return list(sources)
+        # 정렬해서 반환 → 사이드바 목록 순서가 rerun마다 바뀌지 않음
+        return sorted(sources)